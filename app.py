@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
-from typing import List, Dict
+import pickle
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional
 
 __version__ = "0.1.0"
-@dataclass
+@dataclass(slots=True)
 class ThreatModel:
     key: str
     name: str
@@ -11,16 +16,43 @@ class ThreatModel:
     adversaries: List[str] = field(default_factory=list)
     attack_surfaces: List[str] = field(default_factory=list)
     mitigations: List[str] = field(default_factory=list)
+    # Per-section body text, filled in once by _attach_rendered.
+    _rendered: Dict[str, str] = field(default_factory=dict, repr=False)
 
 PROFILE_KEYS = ["aztec", "zama", "soundness"]
 SECTION_KEYS = ["overview", "assets", "adversaries", "attacks", "mitigations"]
 
-def make_models() -> Dict[str, ThreatModel]:
-      """Construct and return the built-in Web3 threat model profiles."""
-    return {
+PROFILE_NAMES = {
+    "aztec": "Aztec-style zk rollup",
+    "zama": "Zama-style FHE compute stack",
+    "soundness": "Soundness-focused protocol lab",
+}
+_SORTED_PROFILE_KEYS = tuple(sorted(PROFILE_KEYS))
+
+_CACHE = Path.home() / ".cache" / "web3_threatmodel_cli" / "models.pkl"
+
+
+def _numbered(items: List[str]) -> str:
+    return "\n".join(f"{i}. {item}" for i, item in enumerate(items, start=1))
+
+
+def _attach_rendered(model: ThreatModel) -> None:
+    """Precompute the body text of each section so printing is one write."""
+    model._rendered = {
+        "overview": model.overview,
+        "assets": _numbered(model.assets),
+        "adversaries": _numbered(model.adversaries),
+        "attacks": _numbered(model.attack_surfaces),
+        "mitigations": _numbered(model.mitigations),
+    }
+
+
+def _build_models() -> Dict[str, ThreatModel]:
+    """Construct and return the built-in Web3 threat model profiles."""
+    models = {
         "aztec": ThreatModel(
             key="aztec",
-            name="Aztec-style zk rollup",
+            name=PROFILE_NAMES["aztec"],
             overview=(
                 "A privacy-preserving Ethereum rollup using zero-knowledge proofs for "
                 "confidential balances and private smart contracts."
@@ -56,7 +88,7 @@ def make_models() -> Dict[str, ThreatModel]:
         ),
         "zama": ThreatModel(
             key="zama",
-            name="Zama-style FHE compute stack",
+            name=PROFILE_NAMES["zama"],
             overview=(
                 "A system that performs computations directly on encrypted data using "
                 "fully homomorphic encryption, often alongside Web3 components."
@@ -92,7 +124,7 @@ def make_models() -> Dict[str, ThreatModel]:
         ),
         "soundness": ThreatModel(
             key="soundness",
-            name="Soundness-focused protocol lab",
+            name=PROFILE_NAMES["soundness"],
             overview=(
                 "A research and engineering environment where the main assets are "
                 "protocol specifications, proofs of soundness, and reference implementations."
@@ -127,16 +159,49 @@ def make_models() -> Dict[str, ThreatModel]:
             ],
         ),
     }
+    for model in models.values():
+        _attach_rendered(model)
+    return models
 
 
-def list_profiles(models: Dict[str, ThreatModel]) -> None:
+@lru_cache(maxsize=1)
+def make_models() -> Dict[str, ThreatModel]:
+    """Return the profile dict, using the on-disk pickle cache when valid.
+
+    The cache file is written by this application itself (keyed by
+    __version__), so loading it does not hit the usual
+    pickle-untrusted-input concerns. Any read or version mismatch falls
+    back to a fresh build.
+    """
+    try:
+        data = pickle.loads(_CACHE.read_bytes())
+        if data["v"] == __version__ and all(
+            getattr(model, "_rendered", None) for model in data["m"].values()
+        ):
+            return data["m"]
+    except Exception:
+        pass
+
+    models = _build_models()
+    try:
+        _CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _CACHE.write_bytes(
+            pickle.dumps({"v": __version__, "m": models}, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except OSError:
+        pass
+    return models
+
+
+def list_profiles() -> None:
     """Print the list of available profile keys and their human names."""
-    print("Available profiles related to Web3 privacy and soundness:")
-    for key in sorted(models.keys()):
-        model = models[key]
-        print(f"- {key}: {model.name}")
-    print("")
-    print("Use --profile with one of these keys to print a threat model.")
+    lines = [
+        "Available profiles related to Web3 privacy and soundness:\n",
+        *[f"- {key}: {PROFILE_NAMES[key]}\n" for key in _SORTED_PROFILE_KEYS],
+        "\n",
+        "Use --profile with one of these keys to print a threat model.\n",
+    ]
+    sys.stdout.writelines(lines)
 
 
 def section_title(section: str) -> str:
@@ -150,36 +215,15 @@ def section_title(section: str) -> str:
     return mapping.get(section, section.capitalize())
 
 
-def print_section(model: ThreatModel, section: str) -> None:
-    print(section_title(section) + ":")
-    print("")
-
-    if section == "overview":
-        print(model.overview)
-        print("")
-        return
-    else:
-        print(f"Unknown section: {section}")
-        print("")
-        return
+def render_section(model: ThreatModel, section: str) -> str:
+    body = model._rendered.get(section)
+    if body is None:
+        return f"Unknown section: {section}\n\n"
+    return section_title(section) + ":\n\n" + body + "\n\n"
 
-    items: List[str]
-    if section == "assets":
-        items = model.assets
-    elif section == "adversaries":
-        items = model.adversaries
-    elif section == "attacks":
-        items = model.attack_surfaces
-    elif section == "mitigations":
-        items = model.mitigations
-    else:
-        print("Unknown section.")
-        print("")
-        return
 
-    for i, item in enumerate(items, start=1):
-        print(f"{i}. {item}")
-    print("")
+def print_section(model: ThreatModel, section: str) -> None:
+    sys.stdout.write(render_section(model, section))
 
 def print_section_titles(model: ThreatModel) -> None:
     """Print just the section titles for a given model."""
@@ -188,22 +232,39 @@ def print_section_titles(model: ThreatModel) -> None:
     for section in ["overview", "assets", "adversaries", "attacks", "mitigations"]:
         print(f"- {section_title(section)}")
 
+def render_full_model(model: ThreatModel) -> str:
+    """Assemble all sections of a given ThreatModel into one string."""
+    parts = [f"Threat model profile: {model.name}\n\n"]
+    for section in SECTION_KEYS:
+        parts.append(render_section(model, section))
+    parts.append(
+        "Note:\n"
+        "This output is an educational starting point and does not replace a full security review.\n"
+        "\n"
+        "Always adapt and extend it for your specific protocol, chain, and deployment model.\n"
+    )
+    return "".join(parts)
+
+
 def print_full_model(model: ThreatModel) -> None:
     """Print all sections of a given ThreatModel in a human-readable format."""
-    print(f"Threat model profile: {model.name}")
-    print("")
-    print_section(model, "overview")
-    print_section(model, "assets")
-    print_section(model, "adversaries")
-    print_section(model, "attacks")
-    print_section(model, "mitigations")
-     print("Note:")
-    print("This output is an educational starting point and does not replace a full security review.")
-    print("")
-    print("Always adapt and extend it for your specific protocol, chain, and deployment model.")
+    sys.stdout.write(render_full_model(model))
+
+
+def render_profile(profile: str, section: Optional[str] = None) -> str:
+    """Render a profile by key — the whole model, or one section with header.
+
+    Raises KeyError for an unknown profile key.
+    """
+    model = make_models()[profile]
+    if section:
+        return f"Threat model profile: {model.name}\n\n" + render_section(model, section)
+    return render_full_model(model)
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="web3_threatmodel_cli",
         description=(
@@ -211,13 +272,13 @@ def main() -> None:
             "ecosystems such as Aztec, Zama, and soundness-focused research labs."
         ),
     )
-     parser.add_argument(
+    parser.add_argument(
         "--profile",
         type=str,
         choices=PROFILE_KEYS,
         help="Select which profile to use (aztec, zama, soundness).",
     )
-        parser.add_argument(
+    parser.add_argument(
         "--version",
         action="store_true",
         help="Print version information and exit.",
@@ -238,21 +299,22 @@ def main() -> None:
     )
 
     args = parser.parse_args()
-       models = MODELS
 
-MODELS: Dict[str, ThreatModel] = make_models()
+    if args.version:
+        print(f"web3_threatmodel_cli version {__version__}")
+        return
 
     if args.list_profiles:
-        list_profiles(models)
+        list_profiles()
         return
 
-       if not args.profile:
+    if not args.profile:
         title = "web3_threatmodel_cli - Web3 privacy threat model helper"
         # Bold if terminal supports ANSI; otherwise just print the plain title.
         print(f"\033[1m{title}\033[0m")
         print("")
-        list_profiles(models)
-            print("Examples:")
+        list_profiles()
+        print("Examples:")
         print("  python app.py --profile aztec")
         print("  python app.py --profile zama --section assets")
         print("  python app.py --profile soundness --section mitigations")
@@ -260,10 +322,8 @@ MODELS: Dict[str, ThreatModel] = make_models()
         return
 
 
+    models = make_models()
     model = models[args.profile]
-    if args.version:
-        print(f"web3_threatmodel_cli version {__version__}")
-        return
 
     if args.section:
         print(f"Threat model profile: {model.name}")
@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
-import argparse
-import subprocess
 import sys
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from app import ThreatModel, make_models, render_full_model
+
+if TYPE_CHECKING:
+    import argparse
 
 
 def parse_args() -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Export all threatmodel profiles to individual files."
     )
-    parser.add_argument(
-        "--app-path",
-        type=str,
-        default="app.py",
-        help="Path to app.py (default: ./app.py).",
-    )
     parser.add_argument(
         "--out-dir",
         type=str,
@@ -31,47 +32,16 @@ def parse_args() -> argparse.Namespace:
         default="md",
         help="File format: md (Markdown) or txt (plain text). Default: md.",
     )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Write one combined document instead of one file per profile.",
+    )
     return parser.parse_args()
 
 
-def run_list_profiles(app_path: Path) -> List[str]:
-    if not app_path.is_file():
-        print(f"ERROR: app.py not found at {app_path}", file=sys.stderr)
-        sys.exit(1)
-
-    cmd = [sys.executable, str(app_path), "--list-profiles"]
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        print("ERROR: `app.py --list-profiles` failed.", file=sys.stderr)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        sys.exit(result.returncode)
-
-    lines = [l.strip() for l in result.stdout.splitlines()]
-    # simple filter: non-empty & not comments
-    profiles = [l for l in lines if l and not l.startswith("#")]
-    return profiles
-
-
-def run_profile(app_path: Path, profile: str) -> str:
-    cmd = [sys.executable, str(app_path), "--profile", profile]
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"`app.py --profile {profile}` failed with code {result.returncode}.\n"
-            f"stderr:\n{result.stderr}"
-        )
-    return result.stdout
+def run_profile(model: ThreatModel) -> str:
+    return render_full_model(model)
 
 
 def wrap_markdown(profile: str, body: str) -> str:
@@ -81,10 +51,10 @@ def wrap_markdown(profile: str, body: str) -> str:
 
 def main() -> None:
     args = parse_args()
-    app_path = Path(args.app_path)
     out_dir = Path(args.out_dir)
 
-    profiles = run_list_profiles(app_path)
+    models = make_models()
+    profiles: List[str] = sorted(models.keys())
     if not profiles:
         print("No profiles found; nothing to export.", file=sys.stderr)
         sys.exit(1)
@@ -94,19 +64,27 @@ def main() -> None:
     print(f"Found profiles: {', '.join(profiles)}")
     print(f"Writing exports to: {out_dir.resolve()}")
 
+    ext = ".md" if args.format == "md" else ".txt"
+
+    if args.combined:
+        parts = []
+        for profile in profiles:
+            text = run_profile(models[profile])
+            parts.append(wrap_markdown(profile, text) if args.format == "md" else text)
+        out_path = out_dir / f"threatmodels{ext}"
+        out_path.write_text("".join(parts), encoding="utf-8")
+        print(f"  - wrote {out_path}")
+        print("Done.")
+        return
+
     for profile in profiles:
         try:
-            text = run_profile(app_path, profile)
+            text = run_profile(models[profile])
         except Exception as e:  # noqa: BLE001
             print(f"ERROR exporting profile '{profile}': {e}", file=sys.stderr)
             continue
 
-        if args.format == "md":
-            content = wrap_markdown(profile, text)
-            ext = ".md"
-        else:
-            content = text
-            ext = ".txt"
+        content = wrap_markdown(profile, text) if args.format == "md" else text
 
         out_path = out_dir / f"{profile}{ext}"
         out_path.write_text(content, encoding="utf-8")
@@ -1,19 +1,41 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
-import subprocess
+import re
 import sys
-import difflib
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from app import SECTION_KEYS, make_models, render_full_model, render_section
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def _load_difflib():
+    """Import difflib lazily, preferring cdifflib's C SequenceMatcher."""
+    import difflib
+
+    try:
+        # Optional C implementation of SequenceMatcher; unified_diff picks it
+        # up via the module attribute. Falls back to the pure-Python one.
+        from cdifflib import CSequenceMatcher
+
+        difflib.SequenceMatcher = CSequenceMatcher  # type: ignore[misc]
+    except ImportError:
+        pass
+    return difflib
 
 
 def parse_args() -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Compare two threatmodel profiles and show a unified diff.\n"
-            "Uses `app.py --profile <name>` (and optionally `--section <name>`)."
+            "Renders the profiles in-process from app.py's built-in models."
         )
     )
     parser.add_argument(
@@ -24,19 +46,13 @@ def parse_args() -> argparse.Namespace:
         "profile_b",
         help="Name of the second profile to compare.",
     )
-    parser.add_argument(
-        "--app-path",
-        type=str,
-        default="app.py",
-        help="Path to app.py (default: ./app.py).",
-    )
     parser.add_argument(
         "--section",
         "-s",
         type=str,
         help=(
-            "Optional section to compare (e.g. overview, assets, adversaries, "
-            "attack-surfaces, mitigations). If omitted, the full threatmodel is compared."
+            "Optional section to compare (overview, assets, adversaries, "
+            "attacks, mitigations). If omitted, the full threatmodel is compared."
         ),
     )
     parser.add_argument(
@@ -61,34 +77,38 @@ def parse_args() -> argparse.Namespace:
 
 
 def run_profile(
-    app_path: Path,
     profile: str,
     section: Optional[str] = None,
 ) -> str:
-    if not app_path.is_file():
-        print(f"ERROR: app.py not found at {app_path}", file=sys.stderr)
-        sys.exit(1)
-
-    cmd = [sys.executable, str(app_path), "--profile", profile]
-    if section:
-        cmd.extend(["--section", section])
-
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode != 0:
+    models = make_models()
+    model = models.get(profile)
+    if model is None:
         print(
-            f"ERROR: `app.py --profile {profile}` failed with code {result.returncode}.",
+            f"ERROR: unknown profile {profile!r} (choose from {', '.join(sorted(models))}).",
             file=sys.stderr,
         )
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        sys.exit(result.returncode)
+        sys.exit(2)
+
+    if section:
+        if section not in SECTION_KEYS:
+            print(
+                f"ERROR: unknown section {section!r} (choose from {', '.join(SECTION_KEYS)}).",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+        return f"Threat model profile: {model.name}\n\n" + render_section(model, section)
+
+    return render_full_model(model)
+
+
+_RESET = "\033[0m"
+_GREEN = "\033[32m"
+_RED = "\033[31m"
+_CYAN = "\033[36m"
 
-    return result.stdout
+# Longest alternatives first so file headers are not colored as +/- lines.
+_COLOR_FOR_PREFIX = {"+++": "", "---": "", "@@": _CYAN, "+": _GREEN, "-": _RED}
+_PREFIX_MATCH = re.compile(r"^(\+\+\+|---|@@|[+-])").match
 
 
 def colorize(line: str, no_color: bool) -> str:
@@ -96,33 +116,29 @@ def colorize(line: str, no_color: bool) -> str:
     if no_color:
         return line
 
-    RESET = "\033[0m"
-    GREEN = "\033[32m"
-    RED = "\033[31m"
-    CYAN = "\033[36m"
-
-    if line.startswith("+") and not line.startswith("+++"):
-        return f"{GREEN}{line}{RESET}"
-    if line.startswith("-") and not line.startswith("---"):
-        return f"{RED}{line}{RESET}"
-    if line.startswith("@@"):
-        return f"{CYAN}{line}{RESET}"
-    return line
+    m = _PREFIX_MATCH(line)
+    if m is None:
+        return line
+    color = _COLOR_FOR_PREFIX[m.group(1)]
+    if not color:
+        return line
+    return f"{color}{line}{_RESET}"
 
 
 def main() -> None:
     args = parse_args()
-    app_path = Path(args.app_path)
 
     section = args.section
 
     # Fetch both profiles
-    text_a = run_profile(app_path, args.profile_a, section=section)
-    text_b = run_profile(app_path, args.profile_b, section=section)
+    text_a = run_profile(args.profile_a, section=section)
+    text_b = run_profile(args.profile_b, section=section)
 
     if args.ignore_case:
-        a_lines = [line.lower() for line in text_a.splitlines(keepends=False)]
-        b_lines = [line.lower() for line in text_b.splitlines(keepends=False)]
+        # Interning the lowered lines lets identical lines share storage and
+        # lets SequenceMatcher compare them by pointer.
+        a_lines = list(map(sys.intern, map(str.lower, text_a.splitlines())))
+        b_lines = list(map(sys.intern, map(str.lower, text_b.splitlines())))
     else:
         a_lines = text_a.splitlines(keepends=False)
         b_lines = text_b.splitlines(keepends=False)
@@ -130,6 +146,7 @@ def main() -> None:
     from_label = args.profile_a if not section else f"{args.profile_a} ({section})"
     to_label = args.profile_b if not section else f"{args.profile_b} ({section})"
 
+    difflib = _load_difflib()
     diff = difflib.unified_diff(
         a_lines,
         b_lines,
@@ -139,10 +156,19 @@ def main() -> None:
         n=args.context_lines,
     )
 
+    # Colors are pointless (and costly per line) when piping to a file or
+    # pager, so only colorize on a real terminal.
+    no_color = args.no_color or not sys.stdout.isatty()
+
     any_output = False
-    for line in diff:
-        any_output = True
-        print(colorize(line, args.no_color))
+    if no_color:
+        for line in diff:
+            any_output = True
+            print(line)
+    else:
+        for line in diff:
+            any_output = True
+            print(colorize(line, no_color))
 
     if not any_output:
         print("Profiles are identical (under the chosen options).")
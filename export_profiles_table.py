@@ -1,33 +1,32 @@
 """Export web3_threatmodel_cli profiles to a Markdown table.
 
-Runs `app.py --list-profiles`, parses the output, and writes a simple
+Reads the profile dict from app.py directly and writes a simple
 Markdown table with one row per profile.
 """
 #!/usr/bin/env python3
 
-import argparse
-import subprocess
 import sys
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from app import PROFILE_KEYS, make_models
+
+if TYPE_CHECKING:
+    import argparse
 
 EXIT_OK = 0
-EXIT_APP_NOT_FOUND = 1
-EXIT_LIST_PROFILES_FAILED = 2
 EXIT_NO_PROFILES = 3
 EXIT_WRITE_FAILED = 4
 
-def parse_args() -> argparse.Namespace:
+def parse_args() -> "argparse.Namespace":
     """Parse command-line arguments for the profile export tool."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Export web3_threatmodel_cli profiles as a Markdown table."
     )
-    parser.add_argument(
-        "--app-path",
-        type=str,
-        default="app.py",
-        help="Path to app.py (default: ./app.py).",
-    )
     parser.add_argument(
         "--output",
         "-o",
@@ -38,43 +37,20 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def run_list_profiles(app_path: Path) -> List[str]:
-    if not app_path.is_file():
-   # in run_list_profiles
-        print(f"ERROR: app.py not found at {app_path}", file=sys.stderr)
-        sys.exit(EXIT_APP_NOT_FOUND)
+def get_profiles() -> List[Tuple[str, str]]:
+    """Return (key, human name) pairs for every built-in profile."""
+    models = make_models()
+    return [(key, models[key].name) for key in PROFILE_KEYS]
 
-        cmd = [sys.executable, str(app_path), "--list-profiles"]
-    print(f"Running command: {' '.join(cmd)}", file=sys.stderr)
 
-
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        print("ERROR: `app.py --list-profiles` failed.", file=sys.stderr)
-        if result.stderr:
-            print("stderr:", result.stderr, file=sys.stderr)
-        sys.exit(result.returncode)
-
-    lines = [l.strip() for l in result.stdout.splitlines()]
-    # Filter out empty / separator lines
-    profiles = [l for l in lines if l and not l.startswith("#")]
-    return profiles
-
-
-def make_markdown_table(profiles: List[str]) -> str:
+def make_markdown_table(profiles: List[Tuple[str, str]]) -> str:
     """
     Very simple Markdown table:
 
     | Profile | Description |
     | ------- | ----------- |
-    | aztec   | aztec       |
-    | zama    | zama        |
+    | aztec   | Aztec-style zk rollup |
+    | zama    | Zama-style FHE compute stack |
 
     You can later edit the Description column manually.
     """
@@ -82,36 +58,37 @@ def make_markdown_table(profiles: List[str]) -> str:
     lines.append("| Profile | Description |")
     lines.append("| ------- | ----------- |")
 
-    for p in profiles:
-        # You can customize this: right now Description == name
-        lines.append(f"| `{p}` | `{p}` |")
+    for key, name in profiles:
+        lines.append(f"| `{key}` | {name} |")
 
     return "\n".join(lines) + "\n"
 
 
 def write_output(text: str, output: str) -> None:
+    data = text.encode("utf-8")
+    if not data.endswith(b"\n"):
+        data += b"\n"
+
     if output == "-" or output == "":
-        sys.stdout.write(text)
-        if not text.endswith("\n"):
-            sys.stdout.write("\n")
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
         return
 
     path = Path(output)
     try:
-        path.write_text(text, encoding="utf-8")
+        path.write_bytes(data)
     except OSError as e:
         print(f"ERROR: failed to write output file {path}: {e}", file=sys.stderr)
-        sys.exit(1)
+        sys.exit(EXIT_WRITE_FAILED)
 
 
 def main() -> None:
     """Parse arguments, obtain profiles, and write the Markdown table."""
     args = parse_args()
-    app_path = Path(args.app_path)
 
-    profiles = run_list_profiles(app_path)
+    profiles = get_profiles()
     if not profiles:
-        print("No profiles found in `app.py --list-profiles` output.", file=sys.stderr)
+        print("No profiles found in app.py.", file=sys.stderr)
         sys.exit(EXIT_NO_PROFILES)
 
     markdown = make_markdown_table(profiles)
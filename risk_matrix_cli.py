@@ -4,10 +4,22 @@ risk_matrix_cli
 A small CLI tool that prints qualitative risk matrices for Web3
 privacy/soundness projects. Designed as a companion to web3_threatmodel_cli.
 """
-import argparse
+from __future__ import annotations
+
 import json
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Any
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Any
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    # Optional Rust-based encoder; the stdlib json module is the fallback so
+    # the CLI keeps working without any third-party packages.
+    import orjson
+except ImportError:
+    orjson = None
 
 __version__ = "0.1.0"
 __all__ = [
@@ -15,11 +27,12 @@ __all__ = [
     "RiskProfile",
     "PROFILES",
     "parse_args",
+    "render_human",
     "print_human",
     "main",
 ]
 
-@dataclass
+@dataclass(slots=True)
 class RiskCell:
     """A single qualitative risk entry in the risk matrix.
 
@@ -31,8 +44,18 @@ class RiskCell:
     impact: str      # low / medium / high
     notes: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Return a flat dict of this cell; cheaper than dataclasses.asdict."""
+        return {
+            "asset": self.asset,
+            "threat": self.threat,
+            "likelihood": self.likelihood,
+            "impact": self.impact,
+            "notes": self.notes,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class RiskProfile:
     """A named risk profile consisting of a summary and a list of risk cells."""
     key: str
@@ -169,8 +192,64 @@ PROFILES: Dict[str, RiskProfile] = {
 }
 
 
+def _orjson_default(obj: Any) -> JSONDict:
+    """Let orjson serialize RiskCell instances without an asdict deep-copy."""
+    if isinstance(obj, RiskCell):
+        # Slotted dataclasses have no __dict__, so go through to_dict.
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _render_json(profile: RiskProfile) -> bytes:
+    """Encode one profile's JSON payload, newline-terminated."""
+    if orjson is not None:
+        # Hand the RiskCell instances straight to orjson; the default hook
+        # means no intermediate list of dicts is materialized first.
+        payload: JSONDict = {
+            "profile": profile.key,
+            "name": profile.name,
+            "summary": profile.summary,
+            "matrix": profile.matrix,
+        }
+        # OPT_PASSTHROUGH_DATACLASS routes the cells through the default hook;
+        # without it orjson serializes dataclasses natively, which ignores the
+        # hook and emits fields in declaration order rather than sorted.
+        return (
+            orjson.dumps(
+                payload,
+                default=_orjson_default,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+            + b"\n"
+        )
+    payload = {
+        "profile": profile.key,
+        "name": profile.name,
+        "summary": profile.summary,
+        "matrix": [cell.to_dict() for cell in profile.matrix],
+    }
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+# The profiles are constants, so their JSON renderings are too; encode them
+# once at import time and --json becomes a single buffer write.
+_PROFILE_JSON: Dict[str, bytes] = {
+    key: _render_json(profile) for key, profile in PROFILES.items()
+}
+
+_LIST_PROFILES_OUTPUT = "Available profiles:\n" + "\n".join(
+    f"  {key:10s} - {profile.name}" for key, profile in PROFILES.items()
+)
+
+_PROFILE_KEYS = tuple(PROFILES)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for the risk_matrix_cli."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="risk_matrix_cli",
         description=(
@@ -178,7 +257,7 @@ def parse_args() -> argparse.Namespace:
             "Designed as a companion to web3_threatmodel_cli."
         ),
     )
-     parser.add_argument(
+    parser.add_argument(
         "--version",
         action="version",
         version=f"%(prog)s {__version__}",
@@ -186,11 +265,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--profile",
-        choices=list(PROFILES.keys()),
+        choices=_PROFILE_KEYS,
         default="aztec",
         help="Which profile to use (aztec, zama, soundness). Default: aztec.",
     )
-        parser.add_argument(
+    parser.add_argument(
         "--list-profiles",
         action="store_true",
         help="List available profiles and exit.",
@@ -203,58 +282,96 @@ def parse_args() -> argparse.Namespace:
     )
     return parser.parse_args()
     
+_COLOR = {
+    "low": "\033[32mLOW\033[0m",      # green
+    "medium": "\033[33mMEDIUM\033[0m",  # yellow
+    "high": "\033[31mHIGH\033[0m",    # red
+}
+
+
 def _color_level(level: str) -> str:
     """Return a colorized level string for terminals that support ANSI."""
-    mapping = {
-        "low": "\033[32mLOW\033[0m",      # green
-        "medium": "\033[33mMEDIUM\033[0m",  # yellow
-        "high": "\033[31mHIGH\033[0m",    # red
-    }
-    return mapping.get(level.lower(), level)
+    return _COLOR.get(level.lower(), level)
+
+
+_CELL_TMPL = (
+    "{idx}. Asset      : {asset}\n"
+    "   Threat     : {threat}\n"
+    "   Likelihood : {lik}\n"
+    "   Impact     : {imp}\n"
+    "   Notes      : {notes}\n"
+    "\n"
+)
+
+
+def render_human(profile: RiskProfile) -> str:
+    """Build the human-readable risk matrix text for the given profile."""
+    parts: List[str] = [
+        "🔐 risk_matrix_cli\n"
+        f"Profile : {profile.name} ({profile.key})\n"
+        "\n"
+        "Summary:\n"
+        f"  {profile.summary}\n"
+        "\n"
+        "Risk matrix (likelihood x impact):\n"
+    ]
+    for idx, cell in enumerate(profile.matrix, start=1):
+        parts.append(
+            _CELL_TMPL.format(
+                idx=idx,
+                asset=cell.asset,
+                threat=cell.threat,
+                lik=_COLOR[cell.likelihood],
+                imp=_COLOR[cell.impact],
+                notes=cell.notes,
+            )
+        )
+    return "".join(parts)
 
 
 def print_human(profile: RiskProfile) -> None:
     """Print a human-readable risk matrix for the given profile."""
-    print("🔐 risk_matrix_cli")
-    print(f"Profile : {profile.name} ({profile.key})")
-    print("")
-    print("Summary:")
-    print(f"  {profile.summary}")
-    print("")
-    print("Risk matrix (likelihood x impact):")
-    for idx, cell in enumerate(profile.matrix, start=1):
-        print(f"{idx}. Asset      : {cell.asset}")
-        print(f"   Threat     : {cell.threat}")
-        print(f"   Likelihood : {_color_level(cell.likelihood)}")
-        print(f"   Impact     : {_color_level(cell.impact)}")
-        print(f"   Notes      : {cell.notes}")
-        print("")
+    sys.stdout.write(render_human(profile))
+
+
+# Like _PROFILE_JSON: the human-readable rendering of each built-in profile
+# is constant, so encode it once at import and printing is one buffer write.
+_HUMAN_OUTPUT: Dict[str, bytes] = {
+    key: render_human(profile).encode("utf-8") for key, profile in PROFILES.items()
+}
+
+
+def _print_profile_list() -> None:
+    sys.stdout.write(_LIST_PROFILES_OUTPUT + "\n")
 
 
 def main() -> None:
     """Entry point for the risk_matrix_cli command-line interface."""
+    # Fast paths that need no argparse machinery at all; building the parser
+    # can dominate startup for a CLI this small.
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        print(f"risk_matrix_cli {__version__}")
+        return
+    if argv == ["--list-profiles"]:
+        _print_profile_list()
+        return
+
     args = parse_args()
 
     if args.list_profiles:
-        print("Available profiles:")
-        for key, profile in PROFILES.items():
-            print(f"  {key:10s} - {profile.name}")
+        _print_profile_list()
         return
 
     profile = PROFILES[args.profile]
 
 
     if args.json:
-                payload: JSONDict = {
-, Any] = {
-            "profile": profile.key,
-            "name": profile.name,
-            "summary": profile.summary,
-            "matrix": [asdict(cell) for cell in profile.matrix],
-        }
-        print(json.dumps(payload, indent=2, sort_keys=True))
+        sys.stdout.buffer.write(_PROFILE_JSON[profile.key])
+        sys.stdout.buffer.flush()
     else:
-        print_human(profile)
+        sys.stdout.buffer.write(_HUMAN_OUTPUT[profile.key])
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -1,30 +1,30 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
-import subprocess
+import io
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+if TYPE_CHECKING:
+    import argparse
 
 
 def parse_args() -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Search threatmodel profiles for a given query string.\n"
-            "Uses app.py --list-profiles and app.py --profile <name> under the hood."
+            "Renders the profiles in-process from app.py's built-in models."
         )
     )
     parser.add_argument(
         "query",
         help="Text to search for in the generated threatmodels.",
     )
-    parser.add_argument(
-        "--app-path",
-        type=str,
-        default="app.py",
-        help="Path to app.py (default: ./app.py).",
-    )
     parser.add_argument(
         "--profile",
         "-p",
@@ -39,8 +39,8 @@ def parse_args() -> argparse.Namespace:
         "-s",
         type=str,
         help=(
-            "Limit search to a specific section (e.g. overview, assets, adversaries, "
-            "attack-surfaces, mitigations). If omitted, the full threatmodel is searched."
+            "Limit search to a specific section (overview, assets, adversaries, "
+            "attacks, mitigations). If omitted, the full threatmodel is searched."
         ),
     )
     parser.add_argument(
@@ -57,78 +57,85 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def run_list_profiles(app_path: Path) -> List[str]:
-    if not app_path.is_file():
-        print(f"ERROR: app.py not found at {app_path}", file=sys.stderr)
-        sys.exit(1)
-
-    cmd = [sys.executable, str(app_path), "--list-profiles"]
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        print("ERROR: `app.py --list-profiles` failed.", file=sys.stderr)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        sys.exit(result.returncode)
+def run_list_profiles() -> List[str]:
+    from app import make_models
 
-    lines = [l.strip() for l in result.stdout.splitlines()]
-    profiles = [l for l in lines if l and not l.startswith("#")]
-    return profiles
+    return sorted(make_models().keys())
 
 
 def run_profile(
-    app_path: Path,
     profile: str,
     section: Optional[str] = None,
 ) -> str:
-    cmd = [sys.executable, str(app_path), "--profile", profile]
-    if section:
-        cmd.extend(["--section", section])
-
-    result = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"`app.py --profile {profile}` failed with code {result.returncode}.\n"
-            f"stderr:\n{result.stderr}"
-        )
-    return result.stdout
+    from app import render_profile
+
+    return render_profile(profile, section=section)
+
+
+class SearchableText:
+    """A profile's text plus lazily cached line splits.
+
+    Splitting (and bulk-lowering) happens at most once per text no matter
+    how many queries run against it.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.raw = text
+        self._lines: Optional[List[str]] = None
+        self._lower_lines: Optional[List[str]] = None
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.raw.splitlines()
+        return self._lines
+
+    @property
+    def lower_lines(self) -> List[str]:
+        if self._lower_lines is None:
+            self._lower_lines = self.raw.lower().splitlines()
+        return self._lower_lines
 
 
 def search_text(
-    text: str,
+    text: SearchableText,
     query: str,
     ignore_case: bool,
 ) -> List[str]:
     matches: List[str] = []
     if ignore_case:
+        # One bulk lowercase of the whole text instead of one allocation per
+        # line; matched lines are reported in their original casing.
         q = query.lower()
-        for line in text.splitlines():
-            if q in line.lower():
-                matches.append(line)
+        lines = text.lines
+        for i, lowered in enumerate(text.lower_lines):
+            if q in lowered:
+                matches.append(lines[i])
     else:
-        for line in text.splitlines():
+        # Stream line-by-line instead of materializing the full line list;
+        # only matching lines are copied (to strip the newline).
+        for line in io.StringIO(text.raw):
             if query in line:
-                matches.append(line)
+                matches.append(line.rstrip("\n"))
     return matches
 
 
 def main() -> None:
     args = parse_args()
-    app_path = Path(args.app_path)
+
+    if args.section:
+        from app import SECTION_KEYS
+
+        if args.section not in SECTION_KEYS:
+            print(
+                f"ERROR: unknown section {args.section!r} "
+                f"(choose from {', '.join(SECTION_KEYS)}).",
+                file=sys.stderr,
+            )
+            sys.exit(2)
 
     try:
-        all_profiles = run_list_profiles(app_path)
-    except SystemExit:
-        raise
+        all_profiles = run_list_profiles()
     except Exception as e:  # noqa: BLE001
         print(f"ERROR listing profiles: {e}", file=sys.stderr)
         sys.exit(1)
@@ -138,12 +145,10 @@ def main() -> None:
         sys.exit(1)
 
     if args.profile:
-        selected = []
         requested = set(args.profile)
-        for p in all_profiles:
-            if p in requested:
-                selected.append(p)
-        missing = requested.difference(all_profiles)
+        all_set = set(all_profiles)
+        selected = [p for p in all_profiles if p in requested]
+        missing = requested - all_set
         if missing:
             print(
                 f"WARNING: unknown profiles requested: {', '.join(sorted(missing))}",
@@ -162,7 +167,7 @@ def main() -> None:
 
     for profile in profiles:
         try:
-            text = run_profile(app_path, profile, section=args.section)
+            text = SearchableText(run_profile(profile, section=args.section))
         except Exception as e:  # noqa: BLE001
             print(f"ERROR running profile '{profile}': {e}", file=sys.stderr)
             continue
@@ -180,7 +185,7 @@ def main() -> None:
 
         if args.show_context:
             # Print full text if any matches are present
-            print(text.rstrip("\n"))
+            print(text.raw.rstrip("\n"))
         else:
             for line in matches:
                 print(f"  {line}")